@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 from textblob import TextBlob
 from collections import Counter, defaultdict
+import argparse
 import glob
 import os
 from datetime import datetime, timedelta
@@ -11,6 +12,11 @@ from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 import string
 
+from report_renderer import ReportRenderer
+from result_cache import CachedResultsMixin
+from review_corpus import SharedCorpusMixin, worker_corpus, worker_shared
+from sentiment_analysis import categorize_sentiment, score_corpus
+
 # Download required NLTK data
 try:
     nltk.data.find('tokenizers/punkt_tab')
@@ -22,10 +28,105 @@ try:
 except LookupError:
     nltk.download('stopwords')
 
-class EnhancedAllTrailsAnalyzer:
-    def __init__(self):
-        """Initialize the enhanced analyzer"""
+# Complaint categories with their keywords
+COMPLAINT_CATEGORIES = {
+    'Battery/Performance': ['battery', 'drain', 'power', 'slow', 'crash', 'freeze'],
+    'Pricing/Billing': ['price', 'cost', 'expensive', 'billing', 'subscription', 'charge', 'money', 'year'],
+    'Features/Functionality': ['feature', 'work', 'broken', 'bug', 'issue', 'problem', 'error'],
+    'User Experience': ['interface', 'confusing', 'difficult', 'hard', 'complicated', 'usability']
+}
+
+# Compact sentiment codes shipped to corpus workers instead of label strings
+SENTIMENT_CODES = {'Positive': 1, 'Neutral': 0, 'Negative': -1}
+
+def preprocess_text(text, stop_words):
+    """Clean and preprocess text for analysis"""
+    if pd.isna(text):
+        return []
+    
+    # Convert to lowercase
+    text = str(text).lower()
+    
+    # Remove punctuation and numbers
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = re.sub(r'\d+', '', text)
+    
+    # Tokenize
+    words = word_tokenize(text)
+    
+    # Remove stop words and short words
+    words = [word for word in words if word not in stop_words and len(word) > 2]
+    
+    return words
+
+def count_corpus_words(start, stop, sentiment_codes):
+    """
+    Count words in positive and negative reviews for a row range of a shared corpus
+    
+    Runs inside CorpusWorkers; the stop words are shared with each worker once.
+    
+    Args:
+        start (int): First review index
+        stop (int): End index (exclusive)
+        sentiment_codes (numpy.ndarray): SENTIMENT_CODES value for each review in the range
+        
+    Returns:
+        tuple: (positive Counter, negative Counter)
+    """
+    corpus = worker_corpus()
+    stop_words = worker_shared('stop_words')
+    positive_freq = Counter()
+    negative_freq = Counter()
+    
+    for code, text in zip(sentiment_codes, corpus.iter_texts(start, stop)):
+        if code == SENTIMENT_CODES['Positive']:
+            positive_freq.update(preprocess_text(text, stop_words))
+        elif code == SENTIMENT_CODES['Negative']:
+            negative_freq.update(preprocess_text(text, stop_words))
+    
+    return positive_freq, negative_freq
+
+def match_corpus_complaints(start, stop, sentiment_codes):
+    """
+    Find negative reviews mentioning each complaint category in a row range of a shared corpus
+    
+    Args:
+        start (int): First review index
+        stop (int): End index (exclusive)
+        sentiment_codes (numpy.ndarray): SENTIMENT_CODES value for each review in the range
+        
+    Returns:
+        dict: Category name -> list of matching review indices
+    """
+    corpus = worker_corpus()
+    matches = {category: [] for category in COMPLAINT_CATEGORIES}
+    
+    for i, code in zip(range(start, stop), sentiment_codes):
+        if code != SENTIMENT_CODES['Negative']:
+            continue
+        text = corpus.text(i).lower()
+        for category, keywords in COMPLAINT_CATEGORIES.items():
+            if any(keyword in text for keyword in keywords):
+                matches[category].append(i)
+    
+    return matches
+
+class EnhancedAllTrailsAnalyzer(CachedResultsMixin, SharedCorpusMixin):
+    def __init__(self, workers=1):
+        """
+        Initialize the enhanced analyzer
+        
+        Args:
+            workers (int): Worker processes for scoring, tokenization and
+                complaint matching; above 1 the reviews are read from a
+                shared memory-mapped corpus
+        """
+        self.workers = workers
         self.df = None
+        self.source_file = None
+        self.pool = None
+        self.renderer = ReportRenderer()
+        self._reset_results()
         self.stop_words = set(stopwords.words('english'))
         # Add app-specific stop words
         self.stop_words.update(['app', 'alltrails', 'trail', 'trails', 'hiking', 'hike', 'use', 'using', 'used'])
@@ -41,24 +142,24 @@ class EnhancedAllTrailsAnalyzer:
         print(f"Loading reviews from: {latest_file}")
         
         self.df = pd.read_csv(latest_file)
+        self.source_file = latest_file
+        self._reset_results()
         
         # Perform basic sentiment analysis
         self.df['full_text'] = self.df['title'].fillna('') + ' ' + self.df['content'].fillna('')
         
-        sentiments = []
-        for text in self.df['full_text']:
-            blob = TextBlob(str(text))
-            sentiments.append(blob.sentiment.polarity)
-        
-        self.df['sentiment_polarity'] = sentiments
-        
-        def categorize_sentiment(polarity):
-            if polarity > 0.1:
-                return 'Positive'
-            elif polarity < -0.1:
-                return 'Negative'
-            else:
-                return 'Neutral'
+        # Workers read the text from a shared corpus instead of pickled slices;
+        # one pool serves scoring, word counts and complaint matching
+        pool = self._corpus_workers()
+        if pool is not None:
+            self.df['sentiment_polarity'], _ = score_corpus(pool)
+        else:
+            sentiments = []
+            for text in self.df['full_text']:
+                blob = TextBlob(str(text))
+                sentiments.append(blob.sentiment.polarity)
+            
+            self.df['sentiment_polarity'] = sentiments
         
         self.df['sentiment_category'] = self.df['sentiment_polarity'].apply(categorize_sentiment)
         self.df['rating_numeric'] = pd.to_numeric(self.df['rating'], errors='coerce')
@@ -69,88 +170,92 @@ class EnhancedAllTrailsAnalyzer:
         print(f"Loaded {len(self.df)} reviews with enhanced features")
         return self.df
     
+    def _worker_shared(self):
+        """Send the stop words to each corpus worker once"""
+        return {'stop_words': self.stop_words}
     
     def _preprocess_text(self, text):
         """Clean and preprocess text for analysis"""
-        if pd.isna(text):
-            return []
-        
-        # Convert to lowercase
-        text = str(text).lower()
-        
-        # Remove punctuation and numbers
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\d+', '', text)
-        
-        # Tokenize
-        words = word_tokenize(text)
-        
-        # Remove stop words and short words
-        words = [word for word in words if word not in self.stop_words and len(word) > 2]
-        
-        return words
+        return preprocess_text(text, self.stop_words)
+    
+    def _sentiment_codes(self):
+        """Encode sentiment categories as an int8 array for corpus workers"""
+        return self.df['sentiment_category'].map(SENTIMENT_CODES).to_numpy(dtype=np.int8)
     
     def analyze_word_frequency_by_sentiment(self):
         """Analyze most common words in positive vs negative reviews"""
-        print("\n" + "="*60)
-        print("WORD FREQUENCY ANALYSIS BY SENTIMENT")
-        print("="*60)
-        
+        return self._cached('word_frequency', self._compute_word_frequency)
+    
+    def _compute_word_frequency(self):
+        """Count words per sentiment and find distinctive ones"""
         # Separate reviews by sentiment
         positive_reviews = self.df[self.df['sentiment_category'] == 'Positive']['full_text']
         negative_reviews = self.df[self.df['sentiment_category'] == 'Negative']['full_text']
         
-        # Get word frequencies
-        positive_words = []
-        negative_words = []
-        
-        for text in positive_reviews:
-            positive_words.extend(self._preprocess_text(text))
-        
-        for text in negative_reviews:
-            negative_words.extend(self._preprocess_text(text))
-        
-        # Count frequencies
-        positive_freq = Counter(positive_words)
-        negative_freq = Counter(negative_words)
-        
-        print(f"\nTOP 15 WORDS IN POSITIVE REVIEWS ({len(positive_reviews)} reviews):")
-        for word, count in positive_freq.most_common(15):
-            print(f"   {word}: {count} times")
-        
-        print(f"\nTOP 15 WORDS IN NEGATIVE REVIEWS ({len(negative_reviews)} reviews):")
-        for word, count in negative_freq.most_common(15):
-            print(f"   {word}: {count} times")
+        pool = self._corpus_workers()
+        if pool is not None:
+            # Tokenize in the workers straight from the shared corpus
+            codes = self._sentiment_codes()
+            positive_freq = Counter()
+            negative_freq = Counter()
+            for chunk_positive, chunk_negative in pool.map(
+                count_corpus_words, lambda start, stop: (codes[start:stop],)
+            ):
+                positive_freq.update(chunk_positive)
+                negative_freq.update(chunk_negative)
+        else:
+            # Get word frequencies
+            positive_words = []
+            negative_words = []
+            
+            for text in positive_reviews:
+                positive_words.extend(self._preprocess_text(text))
+            
+            for text in negative_reviews:
+                negative_words.extend(self._preprocess_text(text))
+            
+            # Count frequencies
+            positive_freq = Counter(positive_words)
+            negative_freq = Counter(negative_words)
         
         # Find words that appear significantly more in one sentiment vs another
-        print(f"\nWORDS MORE COMMON IN NEGATIVE REVIEWS:")
         negative_distinctive = []
         for word, neg_count in negative_freq.most_common(20):
             pos_count = positive_freq.get(word, 0)
             if neg_count > 2 and (neg_count / (pos_count + 1)) > 2:  # At least 2x more common in negative
-                negative_distinctive.append((word, neg_count, pos_count))
-        
-        for word, neg_count, pos_count in negative_distinctive[:10]:
-            ratio = neg_count / (pos_count + 1)
-            print(f"   {word}: {neg_count} negative vs {pos_count} positive (ratio: {ratio:.1f}x)")
+                negative_distinctive.append({
+                    'word': word,
+                    'negative': neg_count,
+                    'positive': pos_count,
+                    'ratio': neg_count / (pos_count + 1)
+                })
         
-        print(f"\nWORDS MORE COMMON IN POSITIVE REVIEWS:")
         positive_distinctive = []
         for word, pos_count in positive_freq.most_common(20):
             neg_count = negative_freq.get(word, 0)
             if pos_count > 5 and (pos_count / (neg_count + 1)) > 3:  # At least 3x more common in positive
-                positive_distinctive.append((word, pos_count, neg_count))
-        
-        for word, pos_count, neg_count in positive_distinctive[:10]:
-            ratio = pos_count / (neg_count + 1)
-            print(f"   {word}: {pos_count} positive vs {neg_count} negative (ratio: {ratio:.1f}x)")
+                positive_distinctive.append({
+                    'word': word,
+                    'positive': pos_count,
+                    'negative': neg_count,
+                    'ratio': pos_count / (neg_count + 1)
+                })
+        
+        return {
+            'positive_review_count': len(positive_reviews),
+            'negative_review_count': len(negative_reviews),
+            'top_positive_words': positive_freq.most_common(15),
+            'top_negative_words': negative_freq.most_common(15),
+            'negative_distinctive': negative_distinctive[:10],
+            'positive_distinctive': positive_distinctive[:10]
+        }
     
     def analyze_sentiment_by_version(self):
         """Analyze how sentiment varies by app version"""
-        print("\n" + "="*60)
-        print("SENTIMENT ANALYSIS BY APP VERSION")
-        print("="*60)
-        
+        return self._cached('version', self._compute_sentiment_by_version)
+    
+    def _compute_sentiment_by_version(self):
+        """Aggregate sentiment and rating per app version"""
         # Group by version
         version_analysis = self.df.groupby('version').agg({
             'sentiment_polarity': ['mean', 'count'],
@@ -164,133 +269,205 @@ class EnhancedAllTrailsAnalyzer:
         # Sort by review count (most reviewed versions first)
         version_analysis = version_analysis.sort_values('review_count', ascending=False)
         
-        print(f"\nSENTIMENT BY VERSION (showing versions with 3+ reviews):")
-        print(f"{'Version':<12} {'Reviews':<8} {'Avg Rating':<12} {'Avg Sentiment':<15} {'Pos%':<6} {'Neg%':<6}")
-        print("-" * 70)
-        
-        for version, row in version_analysis.iterrows():
-            if row['review_count'] >= 3:  # Only show versions with meaningful sample size
-                sentiment_dist = row['sentiment_dist']
-                total = row['review_count']
-                pos_pct = (sentiment_dist.get('Positive', 0) / total) * 100
-                neg_pct = (sentiment_dist.get('Negative', 0) / total) * 100
-                
-                print(f"{version:<12} {int(row['review_count']):<8} {row['avg_rating']:<12.2f} {row['avg_sentiment']:<15.3f} {pos_pct:<6.1f} {neg_pct:<6.1f}")
-        
-        # Check for version-specific issues
-        print(f"\nVERSION-SPECIFIC INSIGHTS:")
-        
-        # Find versions with unusually low sentiment
-        low_sentiment_versions = version_analysis[
-            (version_analysis['avg_sentiment'] < 0.2) & 
-            (version_analysis['review_count'] >= 3)
-        ]
-        
-        if len(low_sentiment_versions) > 0:
-            print(f"   Versions with lower sentiment:")
-            for version, row in low_sentiment_versions.iterrows():
-                print(f"     {version}: {row['avg_sentiment']:.3f} sentiment, {int(row['review_count'])} reviews")
-        
-        # Find versions with high negative percentage
+        versions = []
         for version, row in version_analysis.iterrows():
-            if row['review_count'] >= 3:
-                sentiment_dist = row['sentiment_dist']
-                neg_pct = (sentiment_dist.get('Negative', 0) / row['review_count']) * 100
-                if neg_pct > 20:  # More than 20% negative
-                    print(f"     {version}: {neg_pct:.1f}% negative reviews")
+            sentiment_dist = row['sentiment_dist']
+            total = row['review_count']
+            versions.append({
+                'version': version,
+                'review_count': int(total),
+                'avg_rating': row['avg_rating'],
+                'avg_sentiment': row['avg_sentiment'],
+                'positive_pct': (sentiment_dist.get('Positive', 0) / total) * 100,
+                'negative_pct': (sentiment_dist.get('Negative', 0) / total) * 100
+            })
+        
+        # Only versions with a meaningful sample size feed the insights
+        sampled = [v for v in versions if v['review_count'] >= 3]
+        
+        return {
+            'versions': versions,
+            'low_sentiment_versions': [v['version'] for v in sampled if v['avg_sentiment'] < 0.2],
+            'high_negative_versions': [v['version'] for v in sampled if v['negative_pct'] > 20]
+        }
     
     def analyze_complaint_categories(self):
         """Analyze different categories of complaints in negative reviews"""
-        print("\n" + "="*60)
-        print("COMPLAINT CATEGORY ANALYSIS")
-        print("="*60)
-        
+        return self._cached('complaints', self._compute_complaint_categories)
+    
+    def _compute_complaint_categories(self):
+        """Match negative reviews against complaint keyword groups"""
         # Focus on negative reviews
         negative_reviews = self.df[self.df['sentiment_category'] == 'Negative']
         
-        if len(negative_reviews) == 0:
-            print("No negative reviews found.")
-            return
-        
-        print(f"\nANALYZING {len(negative_reviews)} NEGATIVE REVIEWS:")
-        
-        # Define complaint categories with keywords
-        complaint_categories = {
-            'Battery/Performance': ['battery', 'drain', 'power', 'slow', 'crash', 'freeze'],
-            'Pricing/Billing': ['price', 'cost', 'expensive', 'billing', 'subscription', 'charge', 'money', 'year'],
-            'Features/Functionality': ['feature', 'work', 'broken', 'bug', 'issue', 'problem', 'error'],
-            'User Experience': ['interface', 'confusing', 'difficult', 'hard', 'complicated', 'usability']
-        }
+        pool = self._corpus_workers()
+        if pool is not None:
+            # Classify in the workers straight from the shared corpus
+            codes = self._sentiment_codes()
+            matches = {category: [] for category in COMPLAINT_CATEGORIES}
+            for chunk_matches in pool.map(
+                match_corpus_complaints, lambda start, stop: (codes[start:stop],)
+            ):
+                for category, rows in chunk_matches.items():
+                    matches[category].extend(rows)
+        else:
+            matches = {category: [] for category in COMPLAINT_CATEGORIES}
+            positions = np.flatnonzero(self.df['sentiment_category'] == 'Negative')
+            for i, text in zip(positions, negative_reviews['full_text']):
+                text = str(text).lower()
+                for category, keywords in COMPLAINT_CATEGORIES.items():
+                    if any(keyword in text for keyword in keywords):
+                        matches[category].append(i)
         
         # Count complaints by category
-        category_counts = {}
-        category_examples = {}
+        categories = []
         
-        for category, keywords in complaint_categories.items():
-            count = 0
+        for category, rows in matches.items():
+            count = len(rows)
             examples = []
             
-            for _, review in negative_reviews.iterrows():
-                text = str(review['full_text']).lower()
-                if any(keyword in text for keyword in keywords):
-                    count += 1
-                    if len(examples) < 2:  # Keep up to 2 examples
-                        examples.append({
-                            'title': review['title'][:50],
-                            'rating': review['rating_numeric'],
-                            'content': review['content'][:80]
-                        })
+            # Keep up to 2 examples; missing title or content shows as empty rather than 'nan'
+            for _, review in self.df.iloc[rows[:2]].fillna({'title': '', 'content': ''}).iterrows():
+                examples.append({
+                    'title': str(review['title'])[:50],
+                    'rating': review['rating_numeric'],
+                    'content': str(review['content'])[:80]
+                })
             
             if count > 0:
-                category_counts[category] = count
-                category_examples[category] = examples
-        
-        # Display results
-        print(f"\nCOMPLAINT CATEGORIES:")
-        for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / len(negative_reviews)) * 100
-            print(f"   {category}: {count} reviews ({percentage:.1f}%)")
-            
-            # Show examples
-            if category in category_examples:
-                for i, example in enumerate(category_examples[category][:1], 1):
-                    print(f"     Example: \"{example['title']}...\" ({example['rating']}/5)")
-                    print(f"              \"{example['content']}...\"")
-            print()
+                categories.append({
+                    'category': category,
+                    'count': count,
+                    'percentage': (count / len(negative_reviews)) * 100,
+                    'examples': examples
+                })
+        
+        return {
+            'negative_review_count': len(negative_reviews),
+            'categories': sorted(categories, key=lambda c: c['count'], reverse=True)
+        }
+    
+    def build_report(self):
+        """Assemble a renderable report from the cached analysis results"""
+        words = self.analyze_word_frequency_by_sentiment()
+        versions = self.analyze_sentiment_by_version()
+        complaints = self.analyze_complaint_categories()
+        
+        version_rows = [
+            [v['version'], v['review_count'], f"{v['avg_rating']:.2f}", f"{v['avg_sentiment']:.3f}",
+             f"{v['positive_pct']:.1f}", f"{v['negative_pct']:.1f}"]
+            for v in versions['versions'] if v['review_count'] >= 3
+        ]
+        by_version = {v['version']: v for v in versions['versions']}
+        
+        insight_lines = []
+        if versions['low_sentiment_versions']:
+            insight_lines.append("Versions with lower sentiment:")
+            for version in versions['low_sentiment_versions']:
+                v = by_version[version]
+                insight_lines.append(f"  {version}: {v['avg_sentiment']:.3f} sentiment, {v['review_count']} reviews")
+        for version in versions['high_negative_versions']:
+            insight_lines.append(f"  {version}: {by_version[version]['negative_pct']:.1f}% negative reviews")
+        
+        if complaints['negative_review_count'] == 0:
+            complaint_lines = ["No negative reviews found."]
+        else:
+            complaint_lines = [f"Analyzing {complaints['negative_review_count']} negative reviews"]
+            for c in complaints['categories']:
+                complaint_lines.append(f"{c['category']}: {c['count']} reviews ({c['percentage']:.1f}%)")
+                for example in c['examples'][:1]:
+                    complaint_lines.append(f"  Example: \"{example['title']}...\" ({example['rating']}/5)")
+                    complaint_lines.append(f"           \"{example['content']}...\"")
+        
+        return {
+            'title': 'COMPREHENSIVE ALLTRAILS REVIEW ANALYSIS',
+            'data': {
+                'total_reviews': len(self.df),
+                'word_frequency': words,
+                'version': versions,
+                'complaints': complaints
+            },
+            'sections': [
+                {
+                    'title': f"TOP 15 WORDS IN POSITIVE REVIEWS ({words['positive_review_count']} reviews)",
+                    'lines': [f"{word}: {count} times" for word, count in words['top_positive_words']]
+                },
+                {
+                    'title': f"TOP 15 WORDS IN NEGATIVE REVIEWS ({words['negative_review_count']} reviews)",
+                    'lines': [f"{word}: {count} times" for word, count in words['top_negative_words']]
+                },
+                {
+                    'title': 'WORDS MORE COMMON IN NEGATIVE REVIEWS',
+                    'lines': [
+                        f"{w['word']}: {w['negative']} negative vs {w['positive']} positive (ratio: {w['ratio']:.1f}x)"
+                        for w in words['negative_distinctive']
+                    ]
+                },
+                {
+                    'title': 'WORDS MORE COMMON IN POSITIVE REVIEWS',
+                    'lines': [
+                        f"{w['word']}: {w['positive']} positive vs {w['negative']} negative (ratio: {w['ratio']:.1f}x)"
+                        for w in words['positive_distinctive']
+                    ]
+                },
+                {
+                    'title': 'SENTIMENT BY VERSION (showing versions with 3+ reviews)',
+                    'table': {
+                        'columns': ['Version', 'Reviews', 'Avg Rating', 'Avg Sentiment', 'Pos%', 'Neg%'],
+                        'rows': version_rows
+                    }
+                },
+                {'title': 'VERSION-SPECIFIC INSIGHTS', 'lines': insight_lines},
+                {'title': 'COMPLAINT CATEGORIES', 'lines': complaint_lines}
+            ]
+        }
     
-    def generate_comprehensive_report(self):
-        """Generate a comprehensive analysis report"""
+    def generate_comprehensive_report(self, formats=('text', 'json', 'markdown', 'html')):
+        """
+        Generate a comprehensive analysis report
+        
+        Args:
+            formats (iterable): Report formats to write to results/
+            
+        Returns:
+            list: Paths of the files written
+        """
         if self.df is None:
             print("No data loaded. Please run load_latest_reviews() first.")
-            return
-        
-        print("COMPREHENSIVE ALLTRAILS REVIEW ANALYSIS")
-        print("="*80)
+            return None
         
-        # Run all analyses
-        self.analyze_word_frequency_by_sentiment()
-        self.analyze_sentiment_by_version()
-        self.analyze_complaint_categories()
+        report = self.build_report()
+        print(self.renderer.render(report, 'text'))
         
-        # Save detailed results
-        os.makedirs('results', exist_ok=True)
+        # Save compact summaries rather than re-dumping every review
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        written = self.renderer.save(report, f"results/enhanced_report_{timestamp}", formats)
         
-        # Save enhanced dataset
-        enhanced_file = f"results/enhanced_analysis_{timestamp}.csv"
-        self.df.to_csv(enhanced_file, index=False)
-        print(f"\nEnhanced dataset saved to: {enhanced_file}")
+        for filepath in written:
+            print(f"Report saved to: {filepath}")
+        
+        return written
 
 def main():
     """Main function to run the enhanced analysis"""
+    parser = argparse.ArgumentParser(description="Enhanced AllTrails review analysis")
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help="Worker processes for scoring, tokenization and complaint matching (default: 1)"
+    )
+    args = parser.parse_args()
+    
     print("Starting Enhanced AllTrails Analysis...")
     
-    analyzer = EnhancedAllTrailsAnalyzer()
+    analyzer = EnhancedAllTrailsAnalyzer(workers=args.workers)
     
-    if analyzer.load_latest_reviews() is not None:
-        analyzer.generate_comprehensive_report()
-    else:
-        print("No review data found. Please run apple_reviews.py first.")
+    try:
+        if analyzer.load_latest_reviews() is not None:
+            analyzer.generate_comprehensive_report()
+        else:
+            print("No review data found. Please run apple_reviews.py first.")
+    finally:
+        analyzer.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
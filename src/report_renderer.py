@@ -0,0 +1,276 @@
+import argparse
+import html
+import json
+import os
+import re
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+# Characters with inline meaning in Markdown (and raw HTML)
+MARKDOWN_SPECIAL = re.compile(r'([\\`*_{}\[\]<>#|~!&])')
+
+
+def escape_markdown(text, line_start=False):
+    """
+    Escape user-written text so Markdown shows it literally
+
+    Args:
+        text (str): Text to escape
+        line_start (bool): Whether the text opens a line, where a leading
+            '-', '+' or '1.' would otherwise start a nested list
+    """
+    text = MARKDOWN_SPECIAL.sub(r'\\\1', str(text))
+    if line_start:
+        text = re.sub(r'^(\s*)([-+])', r'\1\\\2', text)
+        text = re.sub(r'^(\s*\d+)\.', r'\1\\.', text)
+    return text
+
+
+class ReportRenderer:
+    """
+    Render cached analysis results as text, JSON, Markdown or HTML
+
+    A report is a plain dict built by the analyzers:
+
+        {
+            'title': 'ALLTRAILS SENTIMENT ANALYSIS RESULTS',
+            'data': {...},        # raw cached results, emitted as JSON
+            'sections': [
+                {
+                    'title': 'OVERVIEW',
+                    'metrics': [('Total Reviews', '120'), ...],
+                    'table': {'columns': [...], 'rows': [[...], ...]},
+                    'lines': ['free-form line', ...]
+                },
+                ...
+            ]
+        }
+
+    Every section key except 'title' is optional. Rendering only formats
+    what is already in the report, so it never touches the review data.
+    The JSON output holds the whole report, so load() can bring a saved
+    report back and render it again without rerunning any analysis.
+    """
+
+    FORMATS = {
+        'text': 'txt',
+        'json': 'json',
+        'markdown': 'md',
+        'html': 'html'
+    }
+
+    def render(self, report, fmt='text'):
+        """
+        Render a report in the requested format
+
+        Args:
+            report (dict): Report built from cached analysis results
+            fmt (str): One of 'text', 'json', 'markdown' or 'html'
+
+        Returns:
+            str: Rendered report
+        """
+        renderers = {
+            'text': self._render_text,
+            'json': self._render_json,
+            'markdown': self._render_markdown,
+            'html': self._render_html
+        }
+        if fmt not in renderers:
+            raise ValueError(f"Unknown report format '{fmt}'. Choose from: {', '.join(renderers)}")
+
+        return renderers[fmt](report)
+
+    def save(self, report, basename, formats=('text', 'json', 'markdown', 'html')):
+        """
+        Write a report to disk once per requested format
+
+        Args:
+            report (dict): Report built from cached analysis results
+            basename (str): Output path without extension
+            formats (iterable): Formats to write
+
+        Returns:
+            list: Paths of the files written
+        """
+        directory = os.path.dirname(basename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        written = []
+        for fmt in formats:
+            filepath = f"{basename}.{self.FORMATS.get(fmt, fmt)}"
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(self.render(report, fmt))
+            written.append(filepath)
+
+        return written
+
+    def load(self, path):
+        """
+        Load a report previously saved in JSON format
+
+        Args:
+            path (str): Path to a .json report written by save()
+
+        Returns:
+            dict: The report, ready to render again
+        """
+        with open(path, encoding='utf-8') as f:
+            report = json.load(f)
+
+        if 'sections' not in report:
+            raise ValueError(f"{path} is not a saved report (no 'sections' key)")
+
+        return report
+
+    def rerender(self, path, formats=('text', 'markdown', 'html')):
+        """
+        Regenerate report files from a saved JSON report
+
+        Args:
+            path (str): Path to a .json report written by save()
+            formats (iterable): Formats to write next to the JSON file
+
+        Returns:
+            list: Paths of the files written
+        """
+        report = self.load(path)
+        return self.save(report, os.path.splitext(path)[0], formats)
+
+    def _render_text(self, report):
+        """Render the report as console-style plain text"""
+        lines = ["", "=" * 60, report['title'], "=" * 60]
+
+        for section in report['sections']:
+            lines.append("")
+            lines.append(f"{section['title']}:")
+
+            for label, value in section.get('metrics', []):
+                lines.append(f"   {label}: {value}")
+
+            table = section.get('table')
+            if table and table['rows']:
+                widths = [
+                    max(len(str(cell)) for cell in [column] + [row[i] for row in table['rows']])
+                    for i, column in enumerate(table['columns'])
+                ]
+                header = "  ".join(f"{column:<{widths[i]}}" for i, column in enumerate(table['columns']))
+                lines.append(f"   {header}")
+                lines.append("   " + "-" * len(header))
+                for row in table['rows']:
+                    lines.append("   " + "  ".join(f"{str(cell):<{widths[i]}}" for i, cell in enumerate(row)))
+
+            for line in section.get('lines', []):
+                lines.append(f"   {line}")
+
+        return "\n".join(lines) + "\n"
+
+    def _render_json(self, report):
+        """Render the full report, raw results included, as JSON"""
+        payload = dict(report)
+        payload.setdefault('generated_at', datetime.now().isoformat(timespec='seconds'))
+        return json.dumps(self._to_builtin(payload), indent=2) + "\n"
+
+    def _render_markdown(self, report):
+        """Render the report as Markdown, escaping all review text"""
+        lines = [f"# {escape_markdown(report['title'])}"]
+
+        for section in report['sections']:
+            lines.extend(["", f"## {escape_markdown(section['title'])}", ""])
+
+            for label, value in section.get('metrics', []):
+                lines.append(f"- **{escape_markdown(label)}**: {escape_markdown(value)}")
+
+            table = section.get('table')
+            if table and table['rows']:
+                if section.get('metrics'):
+                    lines.append("")
+                lines.append("| " + " | ".join(escape_markdown(c) for c in table['columns']) + " |")
+                lines.append("|" + "---|" * len(table['columns']))
+                for row in table['rows']:
+                    lines.append("| " + " | ".join(escape_markdown(c) for c in row) + " |")
+
+            if section.get('lines'):
+                if section.get('metrics') or (table and table['rows']):
+                    lines.append("")
+                for line in section['lines']:
+                    if line.strip():
+                        # Leading spaces mark nested detail lines
+                        depth = (len(line) - len(line.lstrip())) // 2
+                        lines.append("  " * depth + "- " + escape_markdown(line.strip(), line_start=True))
+
+        return "\n".join(lines) + "\n"
+
+    def _render_html(self, report):
+        """Render the report as a standalone HTML page"""
+        title = html.escape(report['title'])
+        parts = [
+            "<!DOCTYPE html>",
+            "<html>",
+            f"<head><meta charset=\"utf-8\"><title>{title}</title></head>",
+            "<body>",
+            f"<h1>{title}</h1>"
+        ]
+
+        for section in report['sections']:
+            parts.append(f"<h2>{html.escape(section['title'])}</h2>")
+
+            if section.get('metrics'):
+                parts.append("<ul>")
+                for label, value in section['metrics']:
+                    parts.append(f"<li><strong>{html.escape(str(label))}</strong>: {html.escape(str(value))}</li>")
+                parts.append("</ul>")
+
+            table = section.get('table')
+            if table and table['rows']:
+                parts.append("<table>")
+                parts.append("<tr>" + "".join(f"<th>{html.escape(str(c))}</th>" for c in table['columns']) + "</tr>")
+                for row in table['rows']:
+                    parts.append("<tr>" + "".join(f"<td>{html.escape(str(c))}</td>" for c in row) + "</tr>")
+                parts.append("</table>")
+
+            for line in section.get('lines', []):
+                if line.strip():
+                    parts.append(f"<p>{html.escape(line)}</p>")
+
+        parts.extend(["</body>", "</html>"])
+        return "\n".join(parts) + "\n"
+
+    def _to_builtin(self, value):
+        """Convert numpy/pandas values into JSON-serializable Python types"""
+        if isinstance(value, dict):
+            return {str(k): self._to_builtin(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._to_builtin(v) for v in value]
+        if isinstance(value, np.integer):
+            return int(value)
+        if isinstance(value, (float, np.floating)):
+            return None if pd.isna(value) else float(value)
+        if isinstance(value, pd.Timestamp):
+            return value.isoformat()
+        return value
+
+
+def main():
+    """Regenerate reports from saved JSON summaries without rerunning the analysis"""
+    parser = argparse.ArgumentParser(description="Re-render saved analysis reports")
+    parser.add_argument('reports', nargs='+', help="Saved .json reports")
+    parser.add_argument(
+        '--format', dest='formats', action='append',
+        choices=['text', 'markdown', 'html'],
+        help="Format to write (repeatable, defaults to all)"
+    )
+    args = parser.parse_args()
+
+    renderer = ReportRenderer()
+    for path in args.reports:
+        for filepath in renderer.rerender(path, args.formats or ('text', 'markdown', 'html')):
+            print(f"Report saved to: {filepath}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+class CachedResultsMixin:
+    """
+    Cache analysis results on an analyzer
+
+    Analyzers call _reset_results() whenever their data changes and wrap
+    each analysis in _cached(), so every report format reuses the same
+    computed results.
+    """
+
+    def _reset_results(self):
+        """Drop cached results, e.g. after loading or rescoring reviews"""
+        self.results = {}
+
+    def _cached(self, name, compute):
+        """Return a cached analysis result, computing it on first use"""
+        if name not in self.results:
+            self.results[name] = compute()
+        return self.results[name]
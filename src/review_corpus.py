@@ -0,0 +1,360 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+
+
+class ReviewCorpus:
+    """
+    Read-only, memory-mapped review corpus shared by analysis workers
+
+    On disk a corpus is a directory holding:
+
+        text.bin          every review's title + content, UTF-8, back to back
+        offsets.npy       int64 byte offsets, review i is text[offsets[i]:offsets[i+1]]
+        ratings.npy       int8 star rating (0 = missing)
+        version_ids.npy   int32 index into versions.json (-1 = missing)
+        dates.npy         datetime64[s] review date (NaT = missing)
+        versions.json     app version strings
+        meta.json         row count, text digest and the size/mtime of the source CSV
+
+    Workers open the same files with mmap, so the operating system shares
+    the pages between processes instead of each worker holding its own
+    copy of the text. Only row ranges need to be sent to a worker; see
+    CorpusWorkers.
+    """
+
+    def __init__(self, path):
+        """
+        Open an existing corpus read-only
+
+        Args:
+            path (str): Corpus directory written by ReviewCorpus.write()
+        """
+        self.path = path
+        self.offsets = np.load(os.path.join(path, 'offsets.npy'), mmap_mode='r')
+        self.ratings = np.load(os.path.join(path, 'ratings.npy'), mmap_mode='r')
+        self.version_ids = np.load(os.path.join(path, 'version_ids.npy'), mmap_mode='r')
+        self.dates = np.load(os.path.join(path, 'dates.npy'), mmap_mode='r')
+
+        with open(os.path.join(path, 'versions.json'), encoding='utf-8') as f:
+            self.versions = json.load(f)
+
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+
+        # np.memmap cannot map an empty file
+        text_file = os.path.join(path, 'text.bin')
+        if os.path.getsize(text_file) > 0:
+            self._text = np.memmap(text_file, dtype=np.uint8, mode='r')
+        else:
+            self._text = np.zeros(0, dtype=np.uint8)
+
+    @classmethod
+    def write(cls, df, path, source=None, digest=None):
+        """
+        Write reviews to a corpus directory
+
+        The corpus is built in a temporary directory and swapped into place,
+        so a corpus that is already memory-mapped is never truncated.
+        Missing rating, version or updated columns are written as 0, -1
+        and NaT.
+
+        Args:
+            df (pandas.DataFrame): Reviews with title and content columns
+            path (str): Output directory
+            source (dict): Source file signature from source_signature() (optional)
+            digest (str): review_digest(df), if already computed (optional)
+
+        Returns:
+            ReviewCorpus: The corpus, opened read-only
+        """
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        build_dir = tempfile.mkdtemp(dir=parent, prefix=f"{os.path.basename(path)}.build-")
+
+        try:
+            cls._write_files(df, build_dir, source, digest or review_digest(df))
+
+            if os.path.exists(path):
+                # Renaming keeps the old files alive for anything still mapping them
+                stale_dir = tempfile.mkdtemp(dir=parent, prefix=f"{os.path.basename(path)}.stale-")
+                os.replace(path, stale_dir)
+                os.replace(build_dir, path)
+                shutil.rmtree(stale_dir, ignore_errors=True)
+            else:
+                os.replace(build_dir, path)
+        except Exception:
+            shutil.rmtree(build_dir, ignore_errors=True)
+            raise
+
+        return cls(path)
+
+    @staticmethod
+    def _write_files(df, path, source, digest):
+        """Write the corpus files into an empty directory"""
+        full_text = review_texts(df)
+
+        offsets = np.zeros(len(df) + 1, dtype=np.int64)
+        with open(os.path.join(path, 'text.bin'), 'wb') as f:
+            for i, text in enumerate(full_text):
+                encoded = text.encode('utf-8')
+                f.write(encoded)
+                offsets[i + 1] = offsets[i] + len(encoded)
+
+        ratings = pd.to_numeric(_column(df, 'rating'), errors='coerce').fillna(0).astype(np.int8).to_numpy()
+
+        versions = _column(df, 'version').dropna().astype(str).unique().tolist()
+        version_lookup = {version: i for i, version in enumerate(versions)}
+        version_ids = np.array(
+            [version_lookup.get(str(v), -1) if not pd.isna(v) else -1 for v in _column(df, 'version')],
+            dtype=np.int32
+        )
+
+        dates = pd.to_datetime(_column(df, 'updated'), errors='coerce', utc=True)
+        dates = dates.dt.tz_localize(None).to_numpy().astype('datetime64[s]')
+
+        np.save(os.path.join(path, 'offsets.npy'), offsets)
+        np.save(os.path.join(path, 'ratings.npy'), ratings)
+        np.save(os.path.join(path, 'version_ids.npy'), version_ids)
+        np.save(os.path.join(path, 'dates.npy'), dates)
+        with open(os.path.join(path, 'versions.json'), 'w', encoding='utf-8') as f:
+            json.dump(versions, f)
+        with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({'rows': len(df), 'source': source, 'digest': digest}, f)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def text_buffer(self, i):
+        """
+        Get the raw UTF-8 bytes of a review without copying
+
+        Args:
+            i (int): Review index
+
+        Returns:
+            memoryview: View into the shared text buffer
+        """
+        return memoryview(self._text[self.offsets[i]:self.offsets[i + 1]])
+
+    def text(self, i):
+        """Decode a single review's text straight from the shared buffer"""
+        return str(self.text_buffer(i), 'utf-8')
+
+    def iter_texts(self, start=0, stop=None):
+        """
+        Iterate over decoded review texts in a row range
+
+        Args:
+            start (int): First review index
+            stop (int): End index (exclusive), defaults to the end of the corpus
+
+        Yields:
+            str: Review text
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        for i in range(start, stop):
+            yield self.text(i)
+
+    def chunks(self, workers):
+        """
+        Split the corpus into contiguous row ranges, one or more per worker
+
+        Args:
+            workers (int): Number of worker processes
+
+        Returns:
+            list: (start, stop) tuples covering every review
+        """
+        size = max(1, -(-len(self) // (workers * 4)))
+        return [(start, min(start + size, len(self))) for start in range(0, len(self), size)]
+
+
+def _column(df, name):
+    """A DataFrame column, or all-missing values when the column is absent"""
+    return df[name] if name in df.columns else pd.Series([None] * len(df), index=df.index)
+
+
+def review_texts(df):
+    """The title + content text stored in the corpus for each review"""
+    return _column(df, 'title').fillna('').astype(str) + ' ' + _column(df, 'content').fillna('').astype(str)
+
+
+def review_digest(df):
+    """
+    Fingerprint the review text of a DataFrame, row order included
+
+    A corpus whose digest matches holds exactly the reviews of df, so
+    corpus row i is df.iloc[i].
+    """
+    hashes = pd.util.hash_pandas_object(review_texts(df), index=False).to_numpy()
+    return hashlib.sha1(hashes.tobytes()).hexdigest()
+
+
+def source_signature(csv_file):
+    """Describe a source CSV by size and modification time, to detect changes"""
+    stat = os.stat(csv_file)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def corpus_path_for(csv_file):
+    """Map a raw reviews CSV to its corpus directory under data/processed/"""
+    name = os.path.splitext(os.path.basename(csv_file))[0]
+    return os.path.join('data', 'processed', f"{name}_corpus")
+
+
+def load_or_write_corpus(df, csv_file, digest=None):
+    """
+    Open the corpus for a reviews CSV, rebuilding it if the CSV or df has changed
+
+    Args:
+        df (pandas.DataFrame): Reviews loaded from csv_file, possibly filtered or reordered
+        csv_file (str): Raw reviews CSV the corpus is built from
+        digest (str): review_digest(df), if already computed (optional)
+
+    Returns:
+        ReviewCorpus: The corpus, opened read-only
+    """
+    path = corpus_path_for(csv_file)
+    source = source_signature(csv_file)
+    digest = digest or review_digest(df)
+
+    try:
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        meta = None
+
+    if meta == {'rows': len(df), 'source': source, 'digest': digest}:
+        return ReviewCorpus(path)
+
+    return ReviewCorpus.write(df, path, source, digest)
+
+
+# Per-process state set up by the pool initializer
+_worker_state = {}
+
+
+def _init_worker(corpus_path, shared):
+    """Pool initializer: map the corpus once per worker process"""
+    _worker_state['corpus'] = ReviewCorpus(corpus_path)
+    _worker_state['shared'] = shared
+
+
+def worker_corpus():
+    """The corpus mapped by the current worker"""
+    return _worker_state['corpus']
+
+
+def worker_shared(name):
+    """A value passed once to every worker through CorpusWorkers(shared=...)"""
+    return _worker_state['shared'][name]
+
+
+class CorpusWorkers:
+    """
+    One process pool bound to a corpus, reused across analysis stages
+
+    Every worker maps the corpus and receives the shared values once, at
+    start-up. Tasks then only carry a row range plus whatever per-range
+    arguments a stage needs.
+    """
+
+    def __init__(self, corpus, workers, shared=None):
+        """
+        Start the workers
+
+        Args:
+            corpus (ReviewCorpus): Corpus the workers read from
+            workers (int): Number of worker processes (1 runs in-process)
+            shared (dict): Values every task needs, sent to each worker once
+        """
+        self.corpus = corpus
+        self.workers = workers
+        self.shared = shared or {}
+        self._pool = None
+        if workers > 1:
+            self._pool = Pool(workers, initializer=_init_worker, initargs=(corpus.path, self.shared))
+
+    def map(self, func, extra_args=None):
+        """
+        Run a worker function over every row range of the corpus
+
+        Args:
+            func (callable): Module-level function taking (start, stop, *extra)
+            extra_args (callable): Optional (start, stop) -> tuple of extra task arguments
+
+        Returns:
+            list: One result per chunk, in corpus order
+        """
+        tasks = []
+        for start, stop in self.corpus.chunks(self.workers):
+            extra = tuple(extra_args(start, stop)) if extra_args else ()
+            tasks.append((start, stop) + extra)
+
+        if self._pool is None:
+            _worker_state['corpus'] = self.corpus
+            _worker_state['shared'] = self.shared
+            return [func(*task) for task in tasks]
+
+        return self._pool.starmap(func, tasks)
+
+    def close(self):
+        """Stop the worker processes"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SharedCorpusMixin:
+    """
+    Keep an analyzer's CorpusWorkers in step with its current DataFrame
+
+    Analyzers set self.workers, self.df, self.source_file and self.pool,
+    and fetch workers through _corpus_workers() before every parallel
+    stage. Filtering, reordering or replacing self.df therefore rebuilds
+    the corpus instead of pairing rows with the wrong review text.
+    """
+
+    def _worker_shared(self):
+        """Values sent once to every worker; override to add more"""
+        return {}
+
+    def _corpus_workers(self):
+        """
+        Get workers whose corpus holds exactly the reviews in self.df
+
+        Returns:
+            CorpusWorkers: Workers to use, or None to run in-process (one
+                worker, or reviews that did not come from a CSV file)
+        """
+        if self.workers <= 1 or self.source_file is None:
+            return None
+
+        digest = review_digest(self.df)
+        if self.pool is not None and self.pool.corpus.meta.get('digest') == digest:
+            return self.pool
+
+        self.close()
+        corpus = load_or_write_corpus(self.df, self.source_file, digest)
+        self.pool = CorpusWorkers(corpus, self.workers, self._worker_shared())
+        return self.pool
+
+    def close(self):
+        """Stop any worker processes started for the shared corpus"""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
@@ -2,16 +2,85 @@ import pandas as pd
 import numpy as np
 from textblob import TextBlob
 from collections import Counter
+import argparse
 import glob
 import os
 from datetime import datetime
 import re
 
-class AllTrailsSentimentAnalyzer:
-    def __init__(self):
-        """Initialize the sentiment analyzer"""
+from report_renderer import ReportRenderer
+from result_cache import CachedResultsMixin
+from review_corpus import SharedCorpusMixin, worker_corpus
+
+def categorize_sentiment(polarity):
+    """Map a polarity score to Positive, Neutral or Negative"""
+    if polarity > 0.1:
+        return 'Positive'
+    elif polarity < -0.1:
+        return 'Negative'
+    else:
+        return 'Neutral'
+
+def score_corpus_range(start, stop):
+    """
+    Score a row range of a shared review corpus
+    
+    Runs inside CorpusWorkers: the text is read from the memory-mapped
+    corpus, so only the row range is sent to the worker.
+    
+    Args:
+        start (int): First review index
+        stop (int): End index (exclusive)
+        
+    Returns:
+        tuple: (polarity, subjectivity) numpy arrays for the range
+    """
+    corpus = worker_corpus()
+    polarity = np.zeros(stop - start)
+    subjectivity = np.zeros(stop - start)
+    
+    for i, text in enumerate(corpus.iter_texts(start, stop)):
+        sentiment = TextBlob(text).sentiment
+        polarity[i] = sentiment.polarity
+        subjectivity[i] = sentiment.subjectivity
+    
+    return polarity, subjectivity
+
+def score_corpus(pool):
+    """
+    Score every review in a shared corpus
+    
+    Args:
+        pool (CorpusWorkers): Workers bound to the corpus to score
+        
+    Returns:
+        tuple: (polarity, subjectivity) numpy arrays, one value per review
+    """
+    results = pool.map(score_corpus_range)
+    if not results:
+        return np.zeros(0), np.zeros(0)
+    
+    return (
+        np.concatenate([polarity for polarity, _ in results]),
+        np.concatenate([subjectivity for _, subjectivity in results])
+    )
+
+class AllTrailsSentimentAnalyzer(CachedResultsMixin, SharedCorpusMixin):
+    def __init__(self, workers=1):
+        """
+        Initialize the sentiment analyzer
+        
+        Args:
+            workers (int): Worker processes for scoring; above 1 the reviews
+                are scored from a shared memory-mapped corpus
+        """
+        self.workers = workers
         self.df = None
+        self.source_file = None
+        self.pool = None
         self.sentiment_results = None
+        self.renderer = ReportRenderer()
+        self._reset_results()
         
     def load_latest_reviews(self):
         """Load the most recent reviews CSV file"""
@@ -27,6 +96,9 @@ class AllTrailsSentimentAnalyzer:
         
         # Load the data
         self.df = pd.read_csv(latest_file)
+        self.source_file = latest_file
+        self.close()
+        self._reset_results()
         print(f"Loaded {len(self.df)} reviews")
         
         return self.df
@@ -42,33 +114,35 @@ class AllTrailsSentimentAnalyzer:
         # Combine title and content for analysis
         self.df['full_text'] = self.df['title'].fillna('') + ' ' + self.df['content'].fillna('')
         
-        # Calculate sentiment scores
-        sentiments = []
-        for text in self.df['full_text']:
-            blob = TextBlob(str(text))
-            sentiments.append({
-                'polarity': blob.sentiment.polarity,  # -1 (negative) to 1 (positive)
-                'subjectivity': blob.sentiment.subjectivity  # 0 (objective) to 1 (subjective)
-            })
-        
-        # Add sentiment data to dataframe
-        self.df['sentiment_polarity'] = [s['polarity'] for s in sentiments]
-        self.df['sentiment_subjectivity'] = [s['subjectivity'] for s in sentiments]
+        # Workers read the text from a shared corpus instead of pickled slices
+        pool = self._corpus_workers()
+        if pool is not None:
+            polarity, subjectivity = score_corpus(pool)
+            self.df['sentiment_polarity'] = polarity
+            self.df['sentiment_subjectivity'] = subjectivity
+        else:
+            # Calculate sentiment scores
+            sentiments = []
+            for text in self.df['full_text']:
+                blob = TextBlob(str(text))
+                sentiments.append({
+                    'polarity': blob.sentiment.polarity,  # -1 (negative) to 1 (positive)
+                    'subjectivity': blob.sentiment.subjectivity  # 0 (objective) to 1 (subjective)
+                })
+            
+            # Add sentiment data to dataframe
+            self.df['sentiment_polarity'] = [s['polarity'] for s in sentiments]
+            self.df['sentiment_subjectivity'] = [s['subjectivity'] for s in sentiments]
         
         # Categorize sentiment
-        def categorize_sentiment(polarity):
-            if polarity > 0.1:
-                return 'Positive'
-            elif polarity < -0.1:
-                return 'Negative'
-            else:
-                return 'Neutral'
-        
         self.df['sentiment_category'] = self.df['sentiment_polarity'].apply(categorize_sentiment)
         
         # Convert rating to numeric
         self.df['rating_numeric'] = pd.to_numeric(self.df['rating'], errors='coerce')
         
+        # Scores changed, so any cached results are stale
+        self._reset_results()
+        
         print("Sentiment analysis complete!")
         return self.df
     
@@ -77,115 +151,165 @@ class AllTrailsSentimentAnalyzer:
         if self.df is None:
             return None
             
-        stats = {
-            'total_reviews': len(self.df),
-            'avg_rating': self.df['rating_numeric'].mean(),
-            'avg_sentiment_polarity': self.df['sentiment_polarity'].mean(),
-            'sentiment_distribution': self.df['sentiment_category'].value_counts().to_dict(),
-            'rating_distribution': self.df['rating_numeric'].value_counts().sort_index().to_dict()
-        }
+        def compute():
+            return {
+                'total_reviews': len(self.df),
+                'avg_rating': self.df['rating_numeric'].mean(),
+                'avg_sentiment_polarity': self.df['sentiment_polarity'].mean(),
+                'sentiment_distribution': self.df['sentiment_category'].value_counts().to_dict(),
+                'rating_distribution': self.df['rating_numeric'].value_counts().sort_index().to_dict()
+            }
         
-        return stats
+        return self._cached('summary', compute)
     
-    def print_analysis_results(self):
-        """Print detailed analysis results"""
+    def generate_sample_reviews(self, per_category=2):
+        """Collect example reviews for each sentiment category"""
         if self.df is None:
-            print("No data to analyze")
-            return
+            return None
             
-        stats = self.generate_summary_stats()
-        
-        print("\n" + "="*60)
-        print("ALLTRAILS SENTIMENT ANALYSIS RESULTS")
-        print("="*60)
+        def compute():
+            samples = {}
+            for sentiment in ['Positive', 'Neutral', 'Negative']:
+                sample_reviews = self.df[self.df['sentiment_category'] == sentiment].head(per_category)
+                # Missing title or content shows as empty rather than 'nan'
+                sample_reviews = sample_reviews.fillna({'title': '', 'content': ''})
+                samples[sentiment] = [
+                    {
+                        'rating': review['rating_numeric'],
+                        'title': str(review['title'])[:60],
+                        'sentiment_polarity': review['sentiment_polarity'],
+                        'content': str(review['content'])[:100]
+                    }
+                    for _, review in sample_reviews.iterrows()
+                ]
+            return samples
         
-        print(f"\nOVERVIEW:")
-        print(f"   Total Reviews: {stats['total_reviews']}")
-        print(f"   Average Rating: {stats['avg_rating']:.2f}/5.0")
-        print(f"   Average Sentiment: {stats['avg_sentiment_polarity']:.3f} (-1=negative, +1=positive)")
+        return self._cached('samples', compute)
+    
+    def generate_correlation(self):
+        """Calculate the correlation between star rating and sentiment"""
+        if self.df is None:
+            return None
+            
+        return self._cached(
+            'correlation',
+            lambda: self.df['rating_numeric'].corr(self.df['sentiment_polarity'])
+        )
+    
+    def build_report(self):
+        """Assemble a renderable report from the cached analysis results"""
+        stats = self.generate_summary_stats()
+        samples = self.generate_sample_reviews()
+        correlation = self.generate_correlation()
+        total = stats['total_reviews']
         
-        print(f"\nSENTIMENT DISTRIBUTION:")
+        sentiment_lines = []
         for sentiment, count in stats['sentiment_distribution'].items():
-            percentage = (count / stats['total_reviews']) * 100
-            print(f"   {sentiment}: {count} reviews ({percentage:.1f}%)")
+            percentage = (count / total) * 100
+            sentiment_lines.append(f"{sentiment}: {count} reviews ({percentage:.1f}%)")
         
-        print(f"\nRATING DISTRIBUTION:")
+        rating_lines = []
         for rating, count in stats['rating_distribution'].items():
             if not pd.isna(rating):
-                percentage = (count / stats['total_reviews']) * 100
+                percentage = (count / total) * 100
                 stars = "*" * int(rating)
-                print(f"   {stars} ({rating}): {count} reviews ({percentage:.1f}%)")
-        
-        # Show examples of each sentiment category
-        print(f"\nSAMPLE REVIEWS:")
-        
-        for sentiment in ['Positive', 'Neutral', 'Negative']:
-            sample_reviews = self.df[self.df['sentiment_category'] == sentiment].head(2)
-            if len(sample_reviews) > 0:
-                print(f"\n   {sentiment.upper()} EXAMPLES:")
-                for idx, review in sample_reviews.iterrows():
-                    print(f"   • Rating: {review['rating_numeric']}/5")
-                    print(f"     Title: {review['title'][:60]}...")
-                    print(f"     Sentiment Score: {review['sentiment_polarity']:.3f}")
-                    print(f"     Content: {review['content'][:100]}...")
-                    print()
-        
-        # Correlation analysis
-        correlation = self.df['rating_numeric'].corr(self.df['sentiment_polarity'])
-        print(f"RATING vs SENTIMENT CORRELATION: {correlation:.3f}")
-        print("   (1.0 = perfect positive correlation, -1.0 = perfect negative correlation)")
-        
-    def save_results(self):
-        """Save the analysis results"""
+                rating_lines.append(f"{stars} ({rating}): {count} reviews ({percentage:.1f}%)")
+        
+        sample_lines = []
+        for sentiment, reviews in samples.items():
+            if reviews:
+                sample_lines.append(f"{sentiment.upper()} EXAMPLES:")
+                for review in reviews:
+                    sample_lines.append(f"• Rating: {review['rating']}/5")
+                    sample_lines.append(f"  Title: {review['title']}...")
+                    sample_lines.append(f"  Sentiment Score: {review['sentiment_polarity']:.3f}")
+                    sample_lines.append(f"  Content: {review['content']}...")
+                    sample_lines.append("")
+        
+        return {
+            'title': 'ALLTRAILS SENTIMENT ANALYSIS RESULTS',
+            'data': {
+                'summary': stats,
+                'samples': samples,
+                'rating_sentiment_correlation': correlation
+            },
+            'sections': [
+                {
+                    'title': 'OVERVIEW',
+                    'metrics': [
+                        ('Total Reviews', total),
+                        ('Average Rating', f"{stats['avg_rating']:.2f}/5.0"),
+                        ('Average Sentiment', f"{stats['avg_sentiment_polarity']:.3f} (-1=negative, +1=positive)")
+                    ]
+                },
+                {'title': 'SENTIMENT DISTRIBUTION', 'lines': sentiment_lines},
+                {'title': 'RATING DISTRIBUTION', 'lines': rating_lines},
+                {'title': 'SAMPLE REVIEWS', 'lines': sample_lines},
+                {
+                    'title': 'RATING VS SENTIMENT CORRELATION',
+                    'metrics': [('Correlation', f"{correlation:.3f}")],
+                    'lines': ["(1.0 = perfect positive correlation, -1.0 = perfect negative correlation)"]
+                }
+            ]
+        }
+    
+    def print_analysis_results(self):
+        """Print detailed analysis results"""
         if self.df is None:
+            print("No data to analyze")
             return
             
-        # Create results directory
-        os.makedirs('results', exist_ok=True)
+        print(self.renderer.render(self.build_report(), 'text'))
         
-        # Save enhanced dataset
+    def save_results(self, formats=('text', 'json', 'markdown', 'html')):
+        """
+        Save compact summaries of the cached analysis results
+        
+        Args:
+            formats (iterable): Report formats to write
+            
+        Returns:
+            list: Paths of the files written
+        """
+        if self.df is None:
+            return None
+            
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"results/sentiment_analysis_{timestamp}.csv"
-        self.df.to_csv(output_file, index=False)
+        written = self.renderer.save(
+            self.build_report(),
+            f"results/sentiment_summary_{timestamp}",
+            formats
+        )
         
-        print(f"\nResults saved to: {output_file}")
+        for filepath in written:
+            print(f"Summary saved to: {filepath}")
         
-        # Save summary statistics
-        stats = self.generate_summary_stats()
-        summary_file = f"results/sentiment_summary_{timestamp}.txt"
-        
-        with open(summary_file, 'w') as f:
-            f.write("ALLTRAILS SENTIMENT ANALYSIS SUMMARY\n")
-            f.write("="*50 + "\n\n")
-            f.write(f"Total Reviews: {stats['total_reviews']}\n")
-            f.write(f"Average Rating: {stats['avg_rating']:.2f}/5.0\n")
-            f.write(f"Average Sentiment: {stats['avg_sentiment_polarity']:.3f}\n\n")
-            f.write("Sentiment Distribution:\n")
-            for sentiment, count in stats['sentiment_distribution'].items():
-                percentage = (count / stats['total_reviews']) * 100
-                f.write(f"  {sentiment}: {count} ({percentage:.1f}%)\n")
-            f.write("\nRating Distribution:\n")
-            for rating, count in stats['rating_distribution'].items():
-                if not pd.isna(rating):
-                    percentage = (count / stats['total_reviews']) * 100
-                    f.write(f"  {rating} stars: {count} ({percentage:.1f}%)\n")
-        
-        print(f"Summary saved to: {summary_file}")
+        return written
 
 def main():
     """Main function to run the sentiment analysis"""
+    parser = argparse.ArgumentParser(description="AllTrails sentiment analysis")
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help="Worker processes for scoring via the shared corpus (default: 1)"
+    )
+    args = parser.parse_args()
+    
     print("Starting AllTrails Sentiment Analysis...")
     
     # Initialize analyzer
-    analyzer = AllTrailsSentimentAnalyzer()
+    analyzer = AllTrailsSentimentAnalyzer(workers=args.workers)
     
     # Load and analyze data
-    if analyzer.load_latest_reviews() is not None:
-        analyzer.analyze_sentiment()
-        analyzer.print_analysis_results()
-        analyzer.save_results()
-    else:
-        print("No review data found. Please run apple_reviews.py first.")
+    try:
+        if analyzer.load_latest_reviews() is not None:
+            analyzer.analyze_sentiment()
+            analyzer.print_analysis_results()
+            analyzer.save_results()
+        else:
+            print("No review data found. Please run apple_reviews.py first.")
+    finally:
+        analyzer.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
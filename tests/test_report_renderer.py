@@ -0,0 +1,147 @@
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import report_renderer
+from report_renderer import ReportRenderer, escape_markdown
+from sentiment_analysis import AllTrailsSentimentAnalyzer
+
+HOSTILE = "*bold* `code` [x](y) <b>hi</b> & more"
+
+
+def _hostile_report():
+    return {
+        'title': 'HOSTILE REVIEWS',
+        'data': {},
+        'sections': [
+            {
+                'title': 'SAMPLES',
+                'metrics': [('Title', HOSTILE)],
+                'table': {'columns': ['Review'], 'rows': [[HOSTILE]]},
+                'lines': ["- starts like a list", "1. starts like a numbered list", HOSTILE]
+            }
+        ]
+    }
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    """A sentiment analyzer scored in-process on a small DataFrame"""
+    monkeypatch.chdir(tmp_path)
+    analyzer = AllTrailsSentimentAnalyzer()
+    analyzer.df = pd.DataFrame({
+        'title': ['Love it', 'Terrible', np.nan, 'Okay'],
+        'content': ['Great maps', 'Awful crashes', 'Wonderful trails', np.nan],
+        'rating': [5, 1, 4, 3]
+    })
+    analyzer.analyze_sentiment()
+    return analyzer
+
+
+def test_escape_markdown_neutralizes_markup():
+    escaped = escape_markdown(HOSTILE)
+
+    assert escaped == r"\*bold\* \`code\` \[x\](y) \<b\>hi\</b\> \& more"
+    assert escape_markdown("- item", line_start=True) == r"\- item"
+    assert escape_markdown("1. item", line_start=True) == r"1\. item"
+    # Only text that opens a line needs list markers escaped
+    assert escape_markdown("2.98") == "2.98"
+
+
+def test_markdown_escapes_hostile_review_text():
+    markdown = ReportRenderer().render(_hostile_report(), 'markdown')
+
+    assert "*bold*" not in markdown.replace(r"\*", "")
+    assert "<b>" not in markdown
+    assert "[x](y)" not in markdown
+    assert r"- \- starts like a list" in markdown
+    assert r"- 1\. starts like a numbered list" in markdown
+
+
+def test_html_escapes_hostile_review_text():
+    page = ReportRenderer().render(_hostile_report(), 'html')
+
+    assert "<b>hi</b>" not in page
+    assert "&lt;b&gt;hi&lt;/b&gt;" in page
+    assert "&amp; more" in page
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        ReportRenderer().render(_hostile_report(), 'pdf')
+
+
+def test_to_builtin_converts_numpy_and_nan():
+    converted = ReportRenderer()._to_builtin({
+        'count': np.int64(3),
+        'mean': np.float64(0.25),
+        'missing': float('nan'),
+        'missing_np': np.float64('nan'),
+        'when': pd.Timestamp('2024-01-01T10:00:00'),
+        1.0: [np.int32(1), (np.float32(0.5),)]
+    })
+
+    assert converted == {
+        'count': 3,
+        'mean': 0.25,
+        'missing': None,
+        'missing_np': None,
+        'when': '2024-01-01T10:00:00',
+        '1.0': [1, [0.5]]
+    }
+    assert type(converted['count']) is int
+    json.dumps(converted)
+
+
+def test_saved_json_rerenders_identically(analyzer, tmp_path):
+    renderer = ReportRenderer()
+    written = renderer.save(analyzer.build_report(), str(tmp_path / 'results' / 'summary'))
+    originals = {path: open(path, encoding='utf-8').read() for path in written if not path.endswith('.json')}
+
+    for path in originals:
+        open(path, 'w').close()
+    renderer.rerender(str(tmp_path / 'results' / 'summary.json'))
+
+    for path, original in originals.items():
+        assert open(path, encoding='utf-8').read() == original
+
+
+def test_cli_rerenders_saved_report(analyzer, tmp_path, monkeypatch):
+    basename = str(tmp_path / 'summary')
+    ReportRenderer().save(analyzer.build_report(), basename, formats=('json',))
+    monkeypatch.setattr(sys, 'argv', ['report_renderer.py', f"{basename}.json", '--format', 'markdown'])
+
+    report_renderer.main()
+
+    assert open(f"{basename}.md", encoding='utf-8').read().startswith("# ALLTRAILS SENTIMENT ANALYSIS RESULTS")
+
+
+def test_missing_review_text_is_rendered_empty(analyzer):
+    text = analyzer.renderer.render(analyzer.build_report(), 'text')
+
+    assert 'nan' not in text
+
+
+def test_results_are_computed_once(analyzer, monkeypatch):
+    computed = []
+    cached = analyzer._cached
+
+    def spy(name, compute):
+        if name not in analyzer.results:
+            computed.append(name)
+        return cached(name, compute)
+
+    monkeypatch.setattr(analyzer, '_cached', spy)
+
+    analyzer.print_analysis_results()
+    analyzer.save_results()
+
+    assert sorted(computed) == ['correlation', 'samples', 'summary']
+
+    analyzer._reset_results()
+    assert analyzer.results == {}
+    analyzer.generate_summary_stats()
+    assert computed.count('summary') == 2
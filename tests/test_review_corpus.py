@@ -0,0 +1,171 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from review_corpus import ReviewCorpus, corpus_path_for, load_or_write_corpus
+from sentiment_analysis import AllTrailsSentimentAnalyzer
+
+REVIEWS = [
+    ("Love it", "Great maps and wonderful offline trail downloads", 5, "1.0"),
+    ("Terrible update", "The app keeps crashing and the battery drains fast", 1, "1.1"),
+    ("Too expensive", "Awful subscription price, billing charged me twice", 2, "1.1"),
+    ("Okay", "Does the job", 3, "1.0"),
+    ("Amazing", "Best hiking companion, amazing maps", 5, "2.0"),
+    ("Bad bug", "Horrible error every time I record, broken feature", 1, "2.0"),
+    ("Café ☕", "Naïve but nice 🥾 trail app, great photos", 4, None),
+    ("Worst", "Confusing interface, hard to use, the worst", 1, "2.0"),
+]
+
+
+@pytest.fixture
+def reviews_csv(tmp_path, monkeypatch):
+    """Write a small reviews CSV where the analyzers look for it"""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('data/raw')
+    df = pd.DataFrame(
+        [
+            {'title': title, 'content': content, 'rating': rating, 'version': version,
+             'updated': f"2024-01-{i + 1:02d}T10:00:00-07:00"}
+            for i, (title, content, rating, version) in enumerate(REVIEWS * 3)
+        ]
+    )
+    path = 'data/raw/alltrails_reviews_test.csv'
+    df.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def enhanced_analysis(monkeypatch):
+    """The enhanced analysis module with NLTK's data-backed tokenizer and stop words stubbed"""
+    import enhanced_analysis
+
+    class StubStopwords:
+        @staticmethod
+        def words(language):
+            return ['the', 'and', 'but', 'every', 'me', 'to', 'of', 'does']
+
+    monkeypatch.setattr(enhanced_analysis, 'stopwords', StubStopwords)
+    monkeypatch.setattr(enhanced_analysis, 'word_tokenize', str.split)
+    return enhanced_analysis
+
+
+def _analyze(workers, mutate=None):
+    analyzer = AllTrailsSentimentAnalyzer(workers=workers)
+    try:
+        analyzer.load_latest_reviews()
+        if mutate is not None:
+            analyzer.analyze_sentiment()
+            analyzer.df = mutate(analyzer.df)
+        return analyzer.analyze_sentiment()
+    finally:
+        analyzer.close()
+
+
+def _enhanced_results(enhanced_analysis, workers, mutate=None):
+    analyzer = enhanced_analysis.EnhancedAllTrailsAnalyzer(workers=workers)
+    try:
+        analyzer.load_latest_reviews()
+        if mutate is not None:
+            analyzer.df = mutate(analyzer.df)
+        return (
+            analyzer.df['sentiment_polarity'].to_numpy(),
+            analyzer.analyze_word_frequency_by_sentiment(),
+            analyzer.analyze_complaint_categories()
+        )
+    finally:
+        analyzer.close()
+
+
+def _filter_and_reverse(df):
+    return df[df['rating'] != 3].iloc[::-1]
+
+
+def test_sentiment_matches_across_workers(reviews_csv):
+    single = _analyze(1)
+    parallel = _analyze(3)
+
+    np.testing.assert_allclose(parallel['sentiment_polarity'], single['sentiment_polarity'])
+    np.testing.assert_allclose(parallel['sentiment_subjectivity'], single['sentiment_subjectivity'])
+    assert (parallel['sentiment_category'] == single['sentiment_category']).all()
+
+
+def test_enhanced_results_match_across_workers(reviews_csv, enhanced_analysis):
+    single_polarity, single_words, single_complaints = _enhanced_results(enhanced_analysis, 1)
+    polarity, words, complaints = _enhanced_results(enhanced_analysis, 3)
+
+    np.testing.assert_allclose(polarity, single_polarity)
+    assert words == single_words
+    assert complaints == single_complaints
+    assert complaints['categories']
+
+
+def test_sentiment_follows_changed_dataframe(reviews_csv):
+    single = _analyze(1, mutate=_filter_and_reverse)
+    parallel = _analyze(3, mutate=_filter_and_reverse)
+
+    assert len(parallel) == len(single) < len(REVIEWS) * 3
+    np.testing.assert_allclose(parallel['sentiment_polarity'], single['sentiment_polarity'])
+
+
+def test_sentiment_without_source_file_runs_in_process(reviews_csv):
+    analyzer = AllTrailsSentimentAnalyzer(workers=3)
+    analyzer.df = pd.read_csv(reviews_csv)
+    try:
+        scored = analyzer.analyze_sentiment()
+    finally:
+        analyzer.close()
+
+    np.testing.assert_allclose(scored['sentiment_polarity'], _analyze(1)['sentiment_polarity'])
+
+
+def test_enhanced_results_follow_changed_dataframe(reviews_csv, enhanced_analysis):
+    single = _enhanced_results(enhanced_analysis, 1, mutate=_filter_and_reverse)
+    parallel = _enhanced_results(enhanced_analysis, 3, mutate=_filter_and_reverse)
+
+    assert parallel[1] == single[1]
+    assert parallel[2] == single[2]
+
+
+def test_corpus_round_trips_text_and_metadata(reviews_csv):
+    df = pd.read_csv(reviews_csv)
+    corpus = load_or_write_corpus(df, reviews_csv)
+
+    assert len(corpus) == len(df)
+    assert corpus.text(6) == "Café ☕ Naïve but nice 🥾 trail app, great photos"
+    assert list(corpus.ratings[:3]) == [5, 1, 2]
+    assert corpus.version_ids[6] == -1
+    assert corpus.versions[corpus.version_ids[1]] == "1.1"
+    assert str(corpus.dates[0]) == "2024-01-01T17:00:00"
+
+
+def test_corpus_rebuilt_when_source_changes(reviews_csv):
+    df = pd.read_csv(reviews_csv)
+    old = load_or_write_corpus(df, reviews_csv)
+    assert load_or_write_corpus(df, reviews_csv).meta == old.meta
+
+    # Same row count, different text
+    df['title'] = 'Terrible'
+    df['content'] = 'awful horrible worst'
+    df.to_csv(reviews_csv, index=False)
+    stat = os.stat(reviews_csv)
+    os.utime(reviews_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    new = load_or_write_corpus(df, reviews_csv)
+    assert new.text(0) == "Terrible awful horrible worst"
+    # The previous mapping stays readable after the rebuild
+    assert old.text(0) == "Love it Great maps and wonderful offline trail downloads"
+    assert os.listdir(os.path.dirname(corpus_path_for(reviews_csv))) == [
+        os.path.basename(corpus_path_for(reviews_csv))
+    ]
+
+
+def test_corpus_tolerates_missing_columns(tmp_path):
+    df = pd.DataFrame({'title': ['Nice', None], 'content': ['Good app', 'Slow']})
+    corpus = ReviewCorpus.write(df, str(tmp_path / 'corpus'))
+
+    assert [corpus.text(i) for i in range(len(corpus))] == ["Nice Good app", " Slow"]
+    assert list(corpus.ratings) == [0, 0]
+    assert list(corpus.version_ids) == [-1, -1]
+    assert np.isnat(corpus.dates).all()